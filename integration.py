@@ -1,98 +1,183 @@
 import sys
+import os
 import json
 import ast
+import functools
 import traceback
-from typing import List, Dict, Any, Optional, Union, Set
+from collections import defaultdict, deque
+from typing import List, Dict, Any, Optional, Union, Set, Tuple
+try:
+    import orjson
+except ImportError:
+    orjson = None
+@functools.lru_cache(maxsize=64)
+def _read_source(file_path: str, mtime_ns: int) -> str:
+    with open(file_path, 'r', encoding='utf-8') as file:
+        return file.read()
+def _read_cached(file_path: str, mtime_ns: Optional[int] = None) -> str:
+    if mtime_ns is None:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    return _read_source(file_path, mtime_ns)
+@functools.lru_cache(maxsize=64)
+def _cached_parse(file_path: str, mtime_ns: int) -> Tuple[str, ast.AST]:
+    source_code = _read_cached(file_path, mtime_ns)
+    return source_code, ast.parse(source_code)
+def parse_source(file_path: str) -> Tuple[str, ast.AST]:
+    return _cached_parse(file_path, os.stat(file_path).st_mtime_ns)
+class TreeIndex:
+    def __init__(self, tree: ast.AST):
+        self.nodes = []  # Nodos en el mismo orden (por niveles) que ast.walk
+        self.by_type = defaultdict(list)  # {tipo: [nodos]}
+        self.scope = {}  # {nodo: FunctionDef/ClassDef más externo que lo contiene, o None}
+        self.functions = {}  # {nodo: (FunctionDef que lo contienen, de fuera a dentro)}
+        self.within = defaultdict(lambda: defaultdict(list))  # {FunctionDef: {tipo: [nodos]}}
+        self.calls_by_func = defaultdict(set)  # {nombre de función: funciones llamadas dentro}
+        self.vars_by_func = defaultdict(set)  # {nombre de función: variables leídas dentro}
+        self.assigners_by_var = defaultdict(set)  # {variable: funciones que la asignan}
+        self._build(tree)
+    def _build(self, tree: ast.AST):
+        todo = deque([(tree, None, ())])
+        while todo:
+            node, scope, functions = todo.popleft()
+            node_type = type(node)
+            if scope is None and node_type in (ast.FunctionDef, ast.ClassDef):
+                scope = node
+            if node_type is ast.FunctionDef:
+                functions += (node,)
+            self.nodes.append(node)
+            self.by_type[node_type].append(node)
+            self.scope[node] = scope
+            self.functions[node] = functions
+            for function in functions:
+                self.within[function][node_type].append(node)
+            if functions:
+                self._index_dependencies(node, node_type, functions)
+            for child in ast.iter_child_nodes(node):
+                todo.append((child, scope, functions))
+    def _index_dependencies(self, node: ast.AST, node_type: type, functions: Tuple[ast.FunctionDef, ...]):
+        if node_type is ast.Call and isinstance(node.func, ast.Name):
+            for function in functions:
+                self.calls_by_func[function.name].add(node.func.id)
+        elif node_type is ast.Name and isinstance(node.ctx, ast.Load):
+            for function in functions:
+                self.vars_by_func[function.name].add(node.id)
+        elif node_type is ast.Assign:
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self.assigners_by_var[target.id].update(function.name for function in functions)
+    def outermost_function(self, node: ast.AST) -> Optional[ast.FunctionDef]:
+        functions = self.functions[node]
+        return functions[0] if functions else None
+@functools.lru_cache(maxsize=64)
+def index_tree(tree: ast.AST) -> TreeIndex:
+    return TreeIndex(tree)
+def _collect_dependencies(nodes, dependencies):
+    for node in nodes:
+        handler = _RETURN_DISPATCH.get(type(node))
+        if handler:
+            handler(node, dependencies)
+def _collect_call_dependencies(node: ast.Call, dependencies):
+    if isinstance(node.func, ast.Name):
+        dependencies.add(node.func.id)
+    _collect_dependencies(node.args, dependencies)
+def _collect_attribute_dependencies(node: ast.Attribute, dependencies):
+    if isinstance(node.value, ast.Name):
+        dependencies.add(node.value.id)
+_TYPE_MAP = {ast.List: 'list', ast.Dict: 'dict', ast.Tuple: 'tuple', ast.Name: 'variable'}
+_RETURN_DISPATCH = {
+    ast.Name: lambda node, deps: deps.add(node.id),
+    ast.Call: _collect_call_dependencies,
+    ast.List: lambda node, deps: _collect_dependencies(node.elts, deps),
+    ast.Tuple: lambda node, deps: _collect_dependencies(node.elts, deps),
+    ast.Set: lambda node, deps: _collect_dependencies(node.elts, deps),
+    ast.Dict: lambda node, deps: _collect_dependencies(node.keys + node.values, deps),
+    ast.BinOp: lambda node, deps: _collect_dependencies((node.left, node.right), deps),
+    ast.UnaryOp: lambda node, deps: _collect_dependencies((node.operand,), deps),
+    ast.IfExp: lambda node, deps: _collect_dependencies((node.test, node.body, node.orelse), deps),
+    ast.Compare: lambda node, deps: _collect_dependencies([node.left] + node.comparators, deps),
+    ast.Attribute: _collect_attribute_dependencies,
+}
 class FunctionIntegrationMapper:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, tree: Optional[ast.AST] = None):
         self.file_path = file_path
-        self.source_code = self._read_source_code()
-        self.tree = ast.parse(self.source_code)
+        if tree is None:
+            self.source_code, self.tree = parse_source(file_path)
+        else:
+            self.source_code = self._read_source_code()
+            self.tree = tree
+        self._index = index_tree(self.tree)
         self.function_definitions = {}
         self.function_calls = {}
         self.variable_flows = {}
+        self._func_scan = {}  # {id(FunctionDef): (tipos de retorno, valores de retorno)}
     def _read_source_code(self) -> str:
-        with open(self.file_path, 'r', encoding='utf-8') as file:
-            return file.read()
+        return _read_cached(self.file_path)
     def _infer_type(self, node: ast.AST) -> str:
-        if isinstance(node, ast.Constant):
-            return type(node.n).__name__
-        elif isinstance(node, ast.Constant):
-            return 'str'
-        elif isinstance(node, ast.List):
-            return 'list'
-        elif isinstance(node, ast.Dict):
-            return 'dict'
-        elif isinstance(node, ast.Tuple):
-            return 'tuple'
-        elif isinstance(node, ast.Name):
-            return 'variable'
-        elif isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Name):
-                return f'function_call({node.func.id})'
-        return 'unknown'
+        node_type = type(node)
+        if node_type is ast.Constant:
+            return type(node.value).__name__
+        if node_type is ast.Call and isinstance(node.func, ast.Name):
+            return f'function_call({node.func.id})'
+        return _TYPE_MAP.get(node_type, 'unknown')
     def _parse_function_definitions(self):
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef):
-                arguments = []
-                argument_types = {}
-                for arg in node.args.args:
-                    arg_name = arg.arg
-                    arguments.append(arg_name)
-                    if arg.annotation:
-                        try:
-                            if isinstance(arg.annotation, ast.Name):
-                                argument_types[arg_name] = arg.annotation.id
-                            else:
-                                argument_types[arg_name] = 'annotated_type'
-                        except:
-                            argument_types[arg_name] = 'unknown'
-                return_type = 'unknown'
-                return_value_types = []
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Return):
-                        if child.value:
-                            inferred_type = self._infer_type(child.value)
-                            return_value_types.append(inferred_type)
-                if return_value_types:
-                    non_variable_types = [t for t in return_value_types if t != 'variable']
-                    return_type = non_variable_types[0] if non_variable_types else return_value_types[0]
-                self.function_definitions[node.name] = {
-                    'node': node,
-                    'arguments': arguments,
-                    'argument_types': argument_types,
-                    'returns': self._extract_return_statements(node),
-                    'return_type': return_type
-                }
-    def _extract_return_statements(self, node: ast.FunctionDef) -> List[str]:
-        returns = []
-        for child in ast.walk(node):
-            if isinstance(child, ast.Return):
+        for node in self._index.by_type[ast.FunctionDef]:
+            arguments = []
+            argument_types = {}
+            for arg in node.args.args:
+                arg_name = arg.arg
+                arguments.append(arg_name)
+                if arg.annotation:
+                    try:
+                        if isinstance(arg.annotation, ast.Name):
+                            argument_types[arg_name] = arg.annotation.id
+                        else:
+                            argument_types[arg_name] = 'annotated_type'
+                    except:
+                        argument_types[arg_name] = 'unknown'
+            return_type = 'unknown'
+            return_value_types, returns = self._scan_function(node)
+            if return_value_types:
+                non_variable_types = [t for t in return_value_types if t != 'variable']
+                return_type = non_variable_types[0] if non_variable_types else return_value_types[0]
+            self.function_definitions[node.name] = {
+                'node': node,
+                'arguments': arguments,
+                'argument_types': argument_types,
+                'returns': returns,
+                'return_type': return_type
+            }
+    def _scan_function(self, node: ast.FunctionDef) -> Tuple[List[str], List[str]]:
+        key = id(node)
+        if key not in self._func_scan:
+            return_value_types = []
+            returns = []
+            for child in self._index.within[node][ast.Return]:
+                if child.value:
+                    return_value_types.append(self._infer_type(child.value))
                 if isinstance(child.value, ast.Name):
                     returns.append(child.value.id)
                 elif isinstance(child.value, ast.Constant):
                     returns.append(str(child.value.value))
-        return returns
+            self._func_scan[key] = (return_value_types, returns)
+        return self._func_scan[key]
     def _trace_function_calls(self):
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef):
-                func_name = node.name
-                self.function_calls[func_name] = []
-                for call_node in ast.walk(node):
-                    if isinstance(call_node, ast.Call):
-                        if isinstance(call_node.func, ast.Name):
-                            called_func = call_node.func.id
-                            args = []
-                            arg_types = []
-                            for arg in call_node.args:
-                                if isinstance(arg, ast.Name):
-                                    args.append(arg.id)
-                                    arg_types.append(self._infer_type(arg))
-                            self.function_calls[func_name].append({
-                                'called_function': called_func,
-                                'arguments': args,
-                                'argument_types': arg_types
-                            })
+        for node in self._index.by_type[ast.FunctionDef]:
+            func_name = node.name
+            self.function_calls[func_name] = []
+            for call_node in self._index.within[node][ast.Call]:
+                if isinstance(call_node.func, ast.Name):
+                    called_func = call_node.func.id
+                    args = []
+                    arg_types = []
+                    for arg in call_node.args:
+                        if isinstance(arg, ast.Name):
+                            args.append(arg.id)
+                            arg_types.append(self._infer_type(arg))
+                    self.function_calls[func_name].append({
+                        'called_function': called_func,
+                        'arguments': args,
+                        'argument_types': arg_types
+                    })
     def _trace_variable_flows(self):
         self.variable_flows = {}
         for func_name, calls in self.function_calls.items():
@@ -130,10 +215,14 @@ class FunctionIntegrationMapper:
                 interaction_paths.append(path)
         return interaction_paths
 class DeadCodeAnalyzer:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, tree: Optional[ast.AST] = None):
         self.file_path = file_path
-        self.source_code = self._read_source_code()
-        self.tree = ast.parse(self.source_code)
+        if tree is None:
+            self.source_code, self.tree = parse_source(file_path)
+        else:
+            self.source_code = self._read_source_code()
+            self.tree = tree
+        self._index = index_tree(self.tree)
         self.defined_variables = set()
         self.used_variables = set()
         self.defined_functions = set()
@@ -144,13 +233,12 @@ class DeadCodeAnalyzer:
         self.functions_affecting_returns = set()
         self.classes_affecting_returns = set()
         self.variable_contexts = {}  # {nombre: {scope: "función/clase", línea: línea}}
-        self.variable_usages = {}  # {variable_name: [function_names]}
+        self.variable_usages = {}  # {variable_name: {function_names}}
         self.global_variables = set()  # Variables usadas en más de una función
         self.local_variables = set()   # Variables usadas en una única función
         self.other_variables = set()   # Variables que no encajan en ninguna categoría
     def _read_source_code(self) -> str:
-        with open(self.file_path, 'r', encoding='utf-8') as file:
-            return file.read()
+        return _read_cached(self.file_path)
     def analyze(self):
         self._find_definitions()
         self._find_usages()
@@ -158,7 +246,7 @@ class DeadCodeAnalyzer:
         self._classify_variables()
         return self._generate_report()
     def _find_definitions(self):
-        for node in ast.walk(self.tree):
+        for node in self._index.nodes:
             if isinstance(node, ast.FunctionDef):
                 self.defined_functions.add(node.name)
                 for arg in node.args.args:
@@ -180,20 +268,16 @@ class DeadCodeAnalyzer:
                             'line': node.lineno
                         }
     def _get_scope(self, node):
-        current = node
-        for ancestor in ast.walk(self.tree):
-            if isinstance(ancestor, (ast.FunctionDef, ast.ClassDef)):
-                for child in ast.walk(ancestor):
-                    if child == current:
-                        if isinstance(ancestor, ast.FunctionDef):
-                            return f"function:{ancestor.name}"
-                        elif isinstance(ancestor, ast.ClassDef):
-                            return f"class:{ancestor.name}"
+        outermost = self._index.scope[node]
+        if isinstance(outermost, ast.FunctionDef):
+            return f"function:{outermost.name}"
+        elif isinstance(outermost, ast.ClassDef):
+            return f"class:{outermost.name}"
         return "global"
     def _find_usages(self):
         for var in self.defined_variables:
-            self.variable_usages[var] = []
-        for node in ast.walk(self.tree):
+            self.variable_usages[var] = set()
+        for node in self._index.nodes:
             current_function = self._get_current_function(node)
             if isinstance(node, ast.Call):
                 if isinstance(node.func, ast.Name):
@@ -202,29 +286,24 @@ class DeadCodeAnalyzer:
                     if isinstance(node.func.value, ast.Name):
                         self.used_variables.add(node.func.value.id)
                         if node.func.value.id in self.variable_usages and current_function:
-                            self.variable_usages[node.func.value.id].append(current_function)
+                            self.variable_usages[node.func.value.id].add(current_function)
             elif isinstance(node, ast.Name):
                 if isinstance(node.ctx, ast.Load):
                     self.used_variables.add(node.id)
                     if node.id in self.variable_usages and current_function:
-                        self.variable_usages[node.id].append(current_function)
+                        self.variable_usages[node.id].add(current_function)
             elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
                 if node.func.id in self.defined_classes:
                     self.used_classes.add(node.func.id)
     def _get_current_function(self, node):
-        for ancestor in ast.walk(self.tree):
-            if isinstance(ancestor, ast.FunctionDef):
-                for child in ast.walk(ancestor):
-                    if child == node:
-                        return ancestor.name
-        return None
+        outermost = self._index.outermost_function(node)
+        return outermost.name if outermost is not None else None
     def _classify_variables(self):
-        for var_name, func_list in self.variable_usages.items():
+        for var_name, functions in self.variable_usages.items():
             if var_name in self.defined_variables and var_name in self.used_variables:
-                unique_functions = set(func_list)
-                if len(unique_functions) > 1:
+                if len(functions) > 1:
                     self.global_variables.add(var_name)
-                elif len(unique_functions) == 1:
+                elif len(functions) == 1:
                     self.local_variables.add(var_name)
                 else:
                     self.other_variables.add(var_name)
@@ -232,8 +311,8 @@ class DeadCodeAnalyzer:
                 self.other_variables.add(var_name)
     def _trace_return_dependencies(self):
         direct_dependencies = set()
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Return) and node.value:
+        for node in self._index.by_type[ast.Return]:
+            if node.value:
                 self._collect_return_dependencies(node.value, direct_dependencies)
         all_dependencies = self._resolve_indirect_dependencies(direct_dependencies)
         for dep in all_dependencies:
@@ -244,93 +323,37 @@ class DeadCodeAnalyzer:
             elif dep in self.defined_classes:
                 self.classes_affecting_returns.add(dep)
     def _collect_return_dependencies(self, node, dependencies):
-        if isinstance(node, ast.Name):
-            dependencies.add(node.id)
-        elif isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Name):
-                dependencies.add(node.func.id)
-            for arg in node.args:
-                self._collect_return_dependencies(arg, dependencies)
-        elif isinstance(node, (ast.List, ast.Tuple, ast.Set)):
-            for elt in node.elts:
-                self._collect_return_dependencies(elt, dependencies)
-        elif isinstance(node, ast.Dict):
-            for key in node.keys:
-                self._collect_return_dependencies(key, dependencies)
-            for value in node.values:
-                self._collect_return_dependencies(value, dependencies)
-        elif isinstance(node, ast.BinOp):
-            self._collect_return_dependencies(node.left, dependencies)
-            self._collect_return_dependencies(node.right, dependencies)
-        elif isinstance(node, ast.UnaryOp):
-            self._collect_return_dependencies(node.operand, dependencies)
-        elif isinstance(node, ast.IfExp):
-            self._collect_return_dependencies(node.test, dependencies)
-            self._collect_return_dependencies(node.body, dependencies)
-            self._collect_return_dependencies(node.orelse, dependencies)
-        elif isinstance(node, ast.Compare):
-            self._collect_return_dependencies(node.left, dependencies)
-            for comparator in node.comparators:
-                self._collect_return_dependencies(comparator, dependencies)
-        elif isinstance(node, ast.Attribute):
-            if isinstance(node.value, ast.Name):
-                dependencies.add(node.value.id)
+        _collect_dependencies((node,), dependencies)
     def _resolve_indirect_dependencies(self, direct_deps):
         all_deps = set(direct_deps)
-        new_deps = set(direct_deps)
-        while new_deps:
-            temp_deps = set()
-            for func_name in [d for d in new_deps if d in self.defined_functions]:
-                calls_inside = self._find_calls_in_function(func_name)
-                for call in calls_inside:
-                    if call not in all_deps:
-                        temp_deps.add(call)
-                vars_inside = self._find_vars_in_function(func_name)
-                for var in vars_inside:
-                    if var not in all_deps:
-                        temp_deps.add(var)
-            for var_name in [d for d in new_deps if d in self.defined_variables]:
-                funcs_affecting_var = self._find_funcs_affecting_var(var_name)
-                for func in funcs_affecting_var:
-                    if func not in all_deps:
-                        temp_deps.add(func)
-            new_deps = temp_deps - all_deps
-            all_deps.update(new_deps)
+        pending = deque(all_deps)
+        while pending:
+            dep = pending.popleft()
+            reachable = []
+            if dep in self.defined_functions:
+                reachable.append(self._find_calls_in_function(dep))
+                reachable.append(self._find_vars_in_function(dep))
+            if dep in self.defined_variables:
+                reachable.append(self._find_funcs_affecting_var(dep))
+            for names in reachable:
+                for name in names:
+                    if name not in all_deps:
+                        all_deps.add(name)
+                        pending.append(name)
         return all_deps
     def _find_calls_in_function(self, func_name):
-        calls = set()
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef) and node.name == func_name:
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Call) and isinstance(child.func, ast.Name):
-                        calls.add(child.func.id)
-        return calls
+        return self._index.calls_by_func.get(func_name, set())
     def _find_vars_in_function(self, func_name):
-        vars_used = set()
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef) and node.name == func_name:
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load):
-                        vars_used.add(child.id)
-        return vars_used
+        return self._index.vars_by_func.get(func_name, set())
     def _find_funcs_affecting_var(self, var_name):
-        funcs = set()
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.FunctionDef):
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Assign):
-                        for target in child.targets:
-                            if isinstance(target, ast.Name) and target.id == var_name:
-                                funcs.add(node.name)
-                                break
-        return funcs
+        return self._index.assigners_by_var.get(var_name, set())
     def _generate_report(self):
         unused_variables = self.defined_variables - self.used_variables
         unused_functions = self.defined_functions - self.called_functions
         unused_classes = self.defined_classes - self.used_classes
-        used_but_not_affecting_variables = (self.used_variables - self.variables_affecting_returns) & self.defined_variables
-        used_but_not_affecting_functions = (self.called_functions - self.functions_affecting_returns) & self.defined_functions
-        used_but_not_affecting_classes = (self.used_classes - self.classes_affecting_returns) & self.defined_classes
+        used_but_not_affecting_variables = (self.defined_variables & self.used_variables) - self.variables_affecting_returns
+        used_but_not_affecting_functions = (self.defined_functions & self.called_functions) - self.functions_affecting_returns
+        used_but_not_affecting_classes = (self.defined_classes & self.used_classes) - self.classes_affecting_returns
         
         return {
             "unused": {
@@ -349,13 +372,13 @@ class DeadCodeAnalyzer:
                 "other_variables": list(self.other_variables)
             },
             "contexts": self.variable_contexts,
-            "variable_usages": {var: list(set(funcs)) for var, funcs in self.variable_usages.items() if var in self.used_variables}
+            "variable_usages": {var: list(funcs) for var, funcs in self.variable_usages.items() if var in self.used_variables}
         }
-def generate_function_integration_map(file_path: str) -> Dict[str, Any]:
-    mapper = FunctionIntegrationMapper(file_path)
+def generate_function_integration_map(file_path: str, tree: Optional[ast.AST] = None) -> Dict[str, Any]:
+    mapper = FunctionIntegrationMapper(file_path, tree)
     return mapper.generate_integration_map()
-def analyze_dead_code(file_path: str) -> Dict[str, Any]:
-    analyzer = DeadCodeAnalyzer(file_path)
+def analyze_dead_code(file_path: str, tree: Optional[ast.AST] = None) -> Dict[str, Any]:
+    analyzer = DeadCodeAnalyzer(file_path, tree)
     return analyzer.analyze()
 def save_dead_code_report(report: Dict[str, Any], output_file: str = "dead_code_report.txt"):
     with open(output_file, 'w', encoding='utf-8') as f:
@@ -410,24 +433,35 @@ def save_dead_code_report(report: Dict[str, Any], output_file: str = "dead_code_
         f.write("\nClases:\n")
         for cls in report["not_affecting_return"]["classes"]:
             f.write(f"  - {cls}\n")
+def dumps_report(report: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
 def main():
-    if len(sys.argv) < 2:
+    args = [arg for arg in sys.argv[1:] if arg != '--quiet']
+    quiet = len(args) < len(sys.argv) - 1
+    if not args:
         print("Por favor, proporciona la ruta al archivo Python a analizar.")
         sys.exit(1)
-    file_path = sys.argv[1]
+    file_path = args[0]
     try:
-        integration_map = generate_function_integration_map(file_path)
+        _, tree = parse_source(file_path)
+        integration_map = generate_function_integration_map(file_path, tree)
         output_json_file = 'function_integration_map.json'
-        with open(output_json_file, 'w', encoding='utf-8') as f:
-            json.dump(integration_map, f, indent=4, ensure_ascii=False)
+        with open(output_json_file, 'wb') as f:
+            f.write(dumps_report(integration_map))
         print(f"Mapa de integración de funciones guardado en '{output_json_file}'")
-        dead_code_report = analyze_dead_code(file_path)
+        dead_code_report = analyze_dead_code(file_path, tree)
         output_txt_file = 'dead_code_report.txt'
         save_dead_code_report(dead_code_report, output_txt_file)
         print(f"Análisis de código muerto guardado en '{output_txt_file}'")
     except Exception as e:
         print(f"Error al analizar el código: {e}")
-        traceback.print_exc()
+        if not quiet:
+            traceback.print_exception(type(e), e, e.__traceback__, limit=-10)
         sys.exit(1)
 if __name__ == "__main__":
     main()
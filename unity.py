@@ -8,11 +8,81 @@ import re
 import importlib.util
 import traceback
 import inspect
+import reprlib
 import hashlib
+import stat
+import functools
 from typing import *
 from dataclasses import dataclass
+from collections import Counter, namedtuple, deque
+from itertools import repeat, starmap
 from contextlib import contextmanager
 import signal
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_PROCESS = psutil.Process(os.getpid())
+
+_TEST_TIMEOUT = 5  # segundos por test
+
+_JIT_ANNOTATIONS = (int, float, complex, bool, inspect.Parameter.empty)
+
+def _run_python(func: Callable, iterations: int) -> None:
+    """Ejecuta la función sin argumentos; el bucle se ejecuta en C, sin coste de intérprete entre llamadas"""
+    deque(starmap(func, repeat((), iterations)), maxlen=0)
+
+def _bench_loop(func: Callable, iterations: int) -> None:
+    """Bucle de medición para funciones compiladas con Numba"""
+    for _ in range(iterations):
+        func()
+
+@functools.lru_cache(maxsize=None)
+def _jit_bench() -> Callable:
+    """Versión compilada de _bench_loop (solo se compila si se usa)"""
+    return njit(_bench_loop)
+
+@functools.lru_cache(maxsize=1024)
+def _cached_sig(func: Callable) -> inspect.Signature:
+    """Firma de la función, calculada una sola vez por objeto función"""
+    return inspect.signature(func)
+
+@functools.lru_cache(maxsize=1024)
+def _parse_expression(source: str) -> ast.expr:
+    """Parsea una sola vez cada expresión de los casos de prueba"""
+    return ast.parse(source, mode='eval').body
+
+_KEYWORD_LITERALS = {'true': True, 'false': False, 'none': None}
+
+_SCALAR_TYPES = (int, float, bool, str, type(None))
+
+# repr acotado a ~100 caracteres sin construir antes la representación completa de contenedores grandes
+_PARAM_REPR = reprlib.Repr()
+_PARAM_REPR.maxstring = _PARAM_REPR.maxother = _PARAM_REPR.maxlong = 100
+_PARAM_REPR.maxlist = _PARAM_REPR.maxtuple = _PARAM_REPR.maxset = _PARAM_REPR.maxfrozenset = _PARAM_REPR.maxdict = 30
+
+# Formatos admitidos: "f(x) == 1", "f(x) -> 1" y ">>> f(x) 1", reconocidos en una sola pasada
+_TEST_CASE_RE = re.compile(r'(?:(?P<case>\w+\([^)]*\))\s*(?P<op>==|->)\s*|>>>\s*(?P<doctest>\w+\([^)]*\))\s*)(?P<expected>-?\d+(?:\.\d+)?)')
+
+@functools.lru_cache(maxsize=32)
+def _compile_forbidden(patterns: Tuple[str, ...]) -> Tuple[Tuple[re.Pattern, ...], Optional[re.Pattern]]:
+    """
+    Precompila los patrones prohibidos. Si ningún patrón tiene grupos propios se unen en una sola expresión
+    para recorrer el código una vez; los patrones con grupos (referencias como \\1) o flags globales se comprueban por separado.
+    """
+    compiled = tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    joined = None
+    if compiled and all(regex.groups == 0 for regex in compiled):
+        try:
+            joined = re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+        except re.error:
+            pass
+    return compiled, joined
 
 @dataclass
 class SecurityConfig:
@@ -22,6 +92,8 @@ class SecurityConfig:
     max_file_size_mb: int = 10
     allowed_imports: set = None
     forbidden_patterns: List[str] = None
+    jit_benchmarks: bool = False  # Compila con Numba las funciones numéricas sin argumentos antes de medirlas
+    collect_param_details: bool = False  # Incluye valor y tamaño de cada parámetro en las validaciones
     
     def __post_init__(self):
         if self.allowed_imports is None:
@@ -37,16 +109,40 @@ class TimeoutError(Exception):
     """Excepción para timeouts"""
     pass
 
+# Nodos que pueden contener sentencias; las importaciones nunca aparecen dentro de expresiones
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler) + ((ast.match_case,) if hasattr(ast, 'match_case') else ())
+
+class _ImportValidator(ast.NodeVisitor):
+    """Recorre solo las sentencias del árbol buscando importaciones no permitidas"""
+    
+    def __init__(self, allowed_imports: set):
+        self.allowed_imports = allowed_imports
+        
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            if alias.name not in self.allowed_imports:
+                raise SecurityError(f"Importación no permitida: {alias.name}")
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.module and node.module not in self.allowed_imports:
+            raise SecurityError(f"Importación no permitida: {node.module}")
+    
+    def generic_visit(self, node: ast.AST):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, _STATEMENT_CONTAINERS):
+                self.visit(child)
+
 class CodeValidator:
     """Validador de código para verificar seguridad"""
     
     def __init__(self, config: SecurityConfig):
         self.config = config
         
-    def validate_file_size(self, file_path: str) -> bool:
-        """Valida el tamaño del archivo"""
+    def validate_file_size(self, file_path: str, file_size: Optional[int] = None) -> bool:
+        """Valida el tamaño del archivo (sin volver a consultarlo si ya se conoce)"""
         try:
-            file_size = os.path.getsize(file_path)
+            if file_size is None:
+                file_size = os.path.getsize(file_path)
             max_size = self.config.max_file_size_mb * 1024 * 1024
             if file_size > max_size:
                 raise SecurityError(f"Archivo demasiado grande: {file_size} bytes")
@@ -56,31 +152,31 @@ class CodeValidator:
     
     def validate_code_patterns(self, code: str) -> bool:
         """Valida que el código no contenga patrones peligrosos"""
-        for pattern in self.config.forbidden_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
+        # Se compila a partir de la lista actual para respetar los patrones añadidos después de crear la configuración
+        patterns = tuple(self.config.forbidden_patterns)
+        compiled, joined = _compile_forbidden(patterns)
+        if joined is not None and joined.search(code) is None:
+            return True
+        # Se informa del primer patrón de la lista que aparece, como al comprobarlos uno a uno
+        for pattern, regex in zip(patterns, compiled):
+            if regex.search(code):
                 raise SecurityError(f"Patrón peligroso detectado: {pattern}")
         return True
     
     def validate_imports(self, tree: ast.AST) -> bool:
         """Valida las importaciones en el código"""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    if alias.name not in self.config.allowed_imports:
-                        raise SecurityError(f"Importación no permitida: {alias.name}")
-            elif isinstance(node, ast.ImportFrom):
-                if node.module and node.module not in self.config.allowed_imports:
-                    raise SecurityError(f"Importación no permitida: {node.module}")
+        _ImportValidator(self.config.allowed_imports).visit(tree)
         return True
     
-    def validate_code(self, file_path: str, code: str) -> bool:
-        """Validación completa del código"""
+    def validate_code(self, file_path: str, code: str, size_checked: bool = False) -> ast.AST:
+        """Validación completa del código; devuelve el AST ya parseado (size_checked omite el tamaño ya validado)"""
         try:
-            self.validate_file_size(file_path)
+            if not size_checked:
+                self.validate_file_size(file_path)
             self.validate_code_patterns(code)
             tree = ast.parse(code)
             self.validate_imports(tree)
-            return True
+            return tree
         except SyntaxError as e:
             raise SecurityError(f"Error de sintaxis: {e}")
 
@@ -101,21 +197,33 @@ def timeout_handler(seconds: int):
     else:
         yield
 
+def rearm_timeout(seconds: int) -> None:
+    """Reinicia la alarma de un timeout_handler activo sin volver a instalar el manejador"""
+    if hasattr(signal, 'SIGALRM'):
+        signal.alarm(seconds)
+
 class SafeParameterValidator:
     """Validador seguro de parámetros de función"""
     
     @staticmethod
-    def validate_function_parameters(func: callable, args: tuple, kwargs: dict) -> Dict[str, Any]:
+    def validate_function_parameters(func: callable, args: tuple, kwargs: dict, signature: Optional[inspect.Signature] = None, collect_details: bool = False) -> Dict[str, Any]:
         """
-        Valida los parámetros de una función de manera segura
+        Valida los parámetros de una función de manera segura.
+        Acepta la firma ya calculada para no inspeccionar la función en cada caso de prueba.
+        El valor y el tamaño de cada parámetro solo se registran si collect_details es True.
         """
         parameter_validation = {"function_name": func.__name__,"parameters": {},"validation_status": "passed","timestamp": time.time()}
         try:
-            signature = inspect.signature(func)
+            if signature is None:
+                signature = _cached_sig(func)
             bound_arguments = signature.bind(*args, **kwargs)
             bound_arguments.apply_defaults()
             for param_name, param_value in bound_arguments.arguments.items():
-                param_info = {"value": str(param_value)[:100],"type": type(param_value).__name__,"size_bytes": sys.getsizeof(param_value)}
+                param_info = {"type": type(param_value).__name__}
+                if collect_details:
+                    param_info["value"] = str(param_value)[:100] if isinstance(param_value, _SCALAR_TYPES) else _PARAM_REPR.repr(param_value)[:100]
+                    param_info["size_bytes"] = sys.getsizeof(param_value)
+                parameter_validation["parameters"][param_name] = param_info
                 param = signature.parameters[param_name]
                 if param.annotation != inspect.Parameter.empty:
                     try:
@@ -127,6 +235,8 @@ class SafeParameterValidator:
                     except Exception as e:
                         param_info["type_validation"] = f"validation_error: {str(e)}"
                 
+        except TimeoutError:
+            raise
         except TypeError as e:
             parameter_validation["validation_status"] = "failed"
             parameter_validation["error"] = str(e)
@@ -135,31 +245,52 @@ class SafeParameterValidator:
             parameter_validation["error"] = str(e)
         return parameter_validation
 
+LoadedModule = namedtuple('LoadedModule', 'module content tree')
+
 class SecureModuleLoader:
     """Cargador seguro de módulos"""
     
     def __init__(self, config: SecurityConfig):
         self.config = config
         self.validator = CodeValidator(config)
+        self._cache: Dict[str, Tuple[int, str, LoadedModule]] = {}  # {ruta: (st_mtime_ns, hash, módulo cargado)}
         
-    def load_module(self, file_path: str) -> Any:
-        """Carga un módulo de manera segura"""
-        if not os.path.exists(file_path):
+    def load_module(self, file_path: str) -> LoadedModule:
+        """
+        Carga de manera segura un módulo junto con su contenido y su AST.
+        Si el archivo no ha cambiado desde la última carga se reutiliza el resultado.
+        """
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
             raise FileNotFoundError(f"Archivo no encontrado: {file_path}")
-        if not os.path.isfile(file_path):
+        if not stat.S_ISREG(file_stat.st_mode):
             raise ValueError(f"La ruta no es un archivo: {file_path}")
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            self.validator.validate_code(file_path, content)
-            module_name = f"safe_module_{hashlib.md5(content.encode()).hexdigest()[:8]}"
+            # El tamaño se valida antes de leer para no cargar en memoria archivos demasiado grandes
+            self.validator.validate_file_size(file_path, file_stat.st_size)
+            mtime_ns = file_stat.st_mtime_ns
+            # Se leen siempre los bytes actuales: el hash detecta cambios aunque la fecha de modificación coincida
+            with open(file_path, 'rb') as file:
+                raw = file.read()
+            digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            cached = self._cache.get(file_path)
+            if cached is not None and cached[0] == mtime_ns and cached[1] == digest:
+                return cached[2]
+            content = raw.decode('utf-8')
+            tree = self.validator.validate_code(file_path, content, size_checked=True)
+            # Se compila el AST ya validado en lugar de dejar que el loader vuelva a parsear el archivo
+            code = compile(tree, file_path, 'exec')
+            module_name = f"safe_module_{digest[:8]}"
             with timeout_handler(self.config.max_execution_time):
                 spec = importlib.util.spec_from_file_location(module_name, file_path)
                 if spec is None or spec.loader is None:
                     raise ImportError(f"No se pudo crear spec para {file_path}")
                 module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-            return module
+                exec(code, module.__dict__)
+            loaded = LoadedModule(module, content, tree)
+            self._cache[file_path] = (mtime_ns, digest, loaded)
+            return loaded
         except Exception as e:
             raise ImportError(f"Error loading module: {e}")
 
@@ -174,15 +305,13 @@ class TestCaseExtractor:
         if not docstring:
             return []
         test_cases = []
-        patterns = [r'(\w+\([^)]*\))\s*==\s*(-?\d+(?:\.\d+)?)',r'(\w+\([^)]*\))\s*->\s*(-?\d+(?:\.\d+)?)',r'>>>\s*(\w+\([^)]*\))\s*(-?\d+(?:\.\d+)?)']
-        for pattern in patterns:
-            matches = re.findall(pattern, docstring)
-            for case, expected in matches:
-                try:
-                    expected_value = float(expected)
-                    test_cases.append({'input': case.strip(),'expected': expected_value,'pattern_used': pattern})
-                except ValueError:
-                    continue
+        for match in _TEST_CASE_RE.finditer(docstring):
+            case = match.group('case') or match.group('doctest')
+            try:
+                expected_value = float(match.group('expected'))
+                test_cases.append({'input': case.strip(),'expected': expected_value,'pattern_used': match.group('op') or '>>>'})
+            except ValueError:
+                continue
         return test_cases
 
 class SafeTestRunner:
@@ -199,45 +328,58 @@ class SafeTestRunner:
         test_results = {}
         parameter_validations = {}
         try:
-            module = self.loader.load_module(file_path)
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            tree = ast.parse(content)
-            for node in tree.body:
+            loaded = self.loader.load_module(file_path)
+            module_dict = loaded.module.__dict__
+            for node in loaded.tree.body:
                 if isinstance(node, ast.FunctionDef):
                     func_name = node.name
-                    if not hasattr(module, func_name):
+                    func = module_dict.get(func_name)
+                    if func is None:
                         continue
-                    func = getattr(module, func_name)
                     docstring = ast.get_docstring(node)
                     test_cases = self.extractor.extract_test_cases(docstring)
                     if test_cases:
                         test_results[func_name] = {}
                         parameter_validations[func_name] = {}
-                        for test_case in test_cases:
-                            test_input = test_case['input']
-                            try:
-                                args = self._parse_function_call(test_input)
-                                if args is None:
-                                    test_results[func_name][test_input] = "Error: Formato de prueba inválido"
-                                    continue
-                                param_validation = self.validator.validate_function_parameters(func, args, {})
-                                parameter_validations[func_name][test_input] = param_validation
-                                if param_validation['validation_status'] == 'passed':
-                                    with timeout_handler(5):  # 5 segundos por test
-                                        result = func(*args)
-                                    expected = test_case['expected']
-                                    if isinstance(result, (int, float)):
-                                        is_passing = abs(result - expected) < 1e-9
-                                    else:
-                                        is_passing = result == expected
-                                    test_results[func_name][test_input] = is_passing
-                                else:
-                                    test_results[func_name][test_input] = "Failed parameter validation"
-                            except TimeoutError:
-                                test_results[func_name][test_input] = "Error: Timeout"
-                            except Exception as e:
-                                test_results[func_name][test_input] = f"Error: {str(e)}"
+                        try:
+                            signature = _cached_sig(func)
+                        except (TypeError, ValueError):
+                            signature = None
+                        try:
+                            # El manejador se instala una vez por función; en cada caso solo se reinicia la alarma
+                            with timeout_handler(_TEST_TIMEOUT):
+                                for test_case in test_cases:
+                                    test_input = test_case['input']
+                                    try:
+                                        rearm_timeout(_TEST_TIMEOUT)
+                                        args = self._parse_function_call(test_input)
+                                        if args is None:
+                                            test_results[func_name][test_input] = "Error: Formato de prueba inválido"
+                                            continue
+                                        param_validation = self.validator.validate_function_parameters(func, args, {}, signature, self.config.collect_param_details)
+                                        parameter_validations[func_name][test_input] = param_validation
+                                        if param_validation['validation_status'] == 'passed':
+                                            deadline = time.perf_counter() + _TEST_TIMEOUT
+                                            result = func(*args)
+                                            if time.perf_counter() > deadline:  # plataformas sin SIGALRM
+                                                test_results[func_name][test_input] = "Error: Timeout"
+                                                continue
+                                            expected = test_case['expected']
+                                            if isinstance(result, (int, float)):
+                                                is_passing = abs(result - expected) < 1e-9
+                                            else:
+                                                is_passing = result == expected
+                                            test_results[func_name][test_input] = is_passing
+                                        else:
+                                            test_results[func_name][test_input] = "Failed parameter validation"
+                                    except TimeoutError:
+                                        test_results[func_name][test_input] = "Error: Timeout"
+                                    except Exception as e:
+                                        test_results[func_name][test_input] = f"Error: {str(e)}"
+                        except TimeoutError:
+                            # Los casos que no llegaron a ejecutarse quedan registrados en el reporte
+                            for test_case in test_cases:
+                                test_results[func_name].setdefault(test_case['input'], "Error: Timeout (no ejecutado)")
         except Exception as e:
             return {"error": str(e),"traceback": traceback.format_exc()}
         return {"test_results": test_results,"parameter_validations": parameter_validations,"execution_timestamp": time.time()}
@@ -245,34 +387,18 @@ class SafeTestRunner:
     def _parse_function_call(self, call_str: str) -> Optional[tuple]:
         """Parsea una llamada de función de manera segura"""
         try:
-            match = re.match(r'\w+\((.*)\)', call_str)
-            if not match:
+            call = _parse_expression(call_str)
+            if not isinstance(call, ast.Call) or not isinstance(call.func, ast.Name) or call.keywords:
                 return None
-            args_str = match.group(1).strip()
-            if not args_str:
-                return ()
             args = []
-            for arg in args_str.split(','):
-                arg = arg.strip()
-                try:
-                    if re.match(r'^-?\d+(\.\d+)?$', arg):  # Números
-                        args.append(float(arg) if '.' in arg else int(arg))
-                    elif arg.startswith('"') and arg.endswith('"'):  # Strings
-                        args.append(arg[1:-1])
-                    elif arg.startswith("'") and arg.endswith("'"):  # Strings
-                        args.append(arg[1:-1])
-                    elif arg.lower() in ['true', 'false']:  # Booleanos
-                        args.append(arg.lower() == 'true')
-                    elif arg.lower() == 'none':  # None
-                        args.append(None)
-                    else:
-                        if arg.startswith('[') and arg.endswith(']'):
-                            args.append(ast.literal_eval(arg))
-                        else:
-                            return None
-                except:
-                    return None
+            for arg in call.args:
+                if isinstance(arg, ast.Name) and arg.id.lower() in _KEYWORD_LITERALS:  # true/false/none
+                    args.append(_KEYWORD_LITERALS[arg.id.lower()])
+                else:
+                    args.append(ast.literal_eval(arg))
             return tuple(args)
+        except TimeoutError:
+            raise
         except Exception:
             return None
 
@@ -288,35 +414,69 @@ class PerformanceAnalyzer:
             iterations = 1000
         metrics = {"iterations": iterations,"functions_tested": len(functions),"timestamp": time.time()}
         try:
-            process = psutil.Process(os.getpid())
-            start_time = time.time()
-            cpu_percent_start = process.cpu_percent()
-            memory_start = process.memory_info().rss
-            executed_operations = 0
+            process = _PROCESS
             with timeout_handler(self.config.max_execution_time):
-                for func_name in functions:
-                    if not hasattr(module, func_name):
-                        continue
-                    func = getattr(module, func_name)
+                benchmarks, jit_functions = self._prepare_benchmarks(module.__dict__, functions)
+                start_time = time.perf_counter()
+                process.cpu_percent()  # Reinicia la referencia de CPU del proceso
+                memory_start = process.memory_info().rss
+                executed_operations = 0
+                for run in benchmarks.values():
                     try:
-                        sig = inspect.signature(func)
-                        if len(sig.parameters) == 0:
-                            for _ in range(iterations):
-                                func()
-                                executed_operations += 1
+                        run(iterations)
+                        executed_operations += iterations
                     except Exception as e:
                         continue
-            end_time = time.time()
-            cpu_percent_end = process.cpu_percent()
+            end_time = time.perf_counter()
+            cpu_usage = process.cpu_percent()
             memory_end = process.memory_info().rss
             execution_time = end_time - start_time
             memory_used = memory_end - memory_start
-            metrics.update({"execution_time_seconds": round(execution_time, 4),"cpu_usage_percent": round(cpu_percent_end - cpu_percent_start, 2),"memory_usage_mb": round(memory_used / (1024 ** 2), 4),"operations_executed": executed_operations,"operations_per_second": round(executed_operations / execution_time, 2) if execution_time > 0 else 0,"average_operation_time_ms": round((execution_time / executed_operations) * 1000, 4) if executed_operations > 0 else 0})
+            metrics.update({"execution_time_seconds": round(execution_time, 4),"cpu_usage_percent": round(cpu_usage, 2),"memory_usage_mb": round(memory_used / (1024 ** 2), 4),"operations_executed": executed_operations,"operations_per_second": round(executed_operations / execution_time, 2) if execution_time > 0 else 0,"average_operation_time_ms": round((execution_time / executed_operations) * 1000, 4) if executed_operations > 0 else 0})
+            if self.config.jit_benchmarks and njit is not None:
+                metrics["jit_functions"] = jit_functions
         except TimeoutError:
             metrics["error"] = "Timeout during performance measurement"
         except Exception as e:
             metrics["error"] = str(e)
         return metrics
+    
+    def _prepare_benchmarks(self, module_dict: Dict[str, Any], functions: List[str]) -> Tuple[Dict[str, Callable[[int], None]], List[str]]:
+        """Prepara, fuera de la medición, un ejecutor por cada función sin parámetros"""
+        benchmarks = {}
+        jit_functions = []
+        for func_name in functions:
+            func = module_dict.get(func_name)
+            if func is None:
+                continue
+            try:
+                if len(_cached_sig(func).parameters) != 0:
+                    continue
+            except Exception:
+                continue
+            runner = self._jit_runner(func)
+            if runner is not None:
+                jit_functions.append(func_name)
+            else:
+                runner = functools.partial(_run_python, func)
+            benchmarks[func_name] = runner
+        return benchmarks, jit_functions
+    
+    def _jit_runner(self, func: Callable) -> Optional[Callable[[int], None]]:
+        """Compila con Numba una función numérica si está activado; None si no es posible"""
+        if not self.config.jit_benchmarks or njit is None:
+            return None
+        signature = _cached_sig(func)
+        annotations = [param.annotation for param in signature.parameters.values()] + [signature.return_annotation]
+        if any(annotation not in _JIT_ANNOTATIONS for annotation in annotations):
+            return None
+        try:
+            compiled = njit(func)
+            bench = _jit_bench()
+            bench(compiled, 1)  # Fuerza la compilación antes de empezar a medir
+        except Exception:
+            return None
+        return functools.partial(bench, compiled)
 
 class UnityAnalyzer:
     """Clase principal del analizador Unity"""
@@ -334,12 +494,9 @@ class UnityAnalyzer:
             if "error" in test_data:
                 report["error"] = test_data["error"]
                 return report
-            module = self.test_runner.loader.load_module(file_path)
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            tree = ast.parse(content)
-            functions = [node.name for node in tree.body if isinstance(node, ast.FunctionDef)]
-            performance_metrics = self.performance_analyzer.measure_performance(module, functions)
+            loaded = self.test_runner.loader.load_module(file_path)
+            functions = [node.name for node in loaded.tree.body if isinstance(node, ast.FunctionDef)]
+            performance_metrics = self.performance_analyzer.measure_performance(loaded.module, functions)
             test_summary = self._calculate_test_summary(test_data.get('test_results', {}))
             report.update({"tests": test_data.get('test_results', {}),"parameter_validations": test_data.get('parameter_validations', {}),"performance": performance_metrics,"test_summary": test_summary,"functions_found": functions,"status": "success"})
         except Exception as e:
@@ -350,37 +507,42 @@ class UnityAnalyzer:
     
     def _calculate_test_summary(self, test_results: Dict) -> Dict[str, Any]:
         """Calcula resumen de pruebas"""
-        total_tests = 0
-        passed_tests = 0
-        failed_tests = 0
-        error_tests = 0
-        for func_results in test_results.values():
-            if isinstance(func_results, dict):
-                for result in func_results.values():
-                    total_tests += 1
-                    if result is True:
-                        passed_tests += 1
-                    elif result is False:
-                        failed_tests += 1
-                    else:
-                        error_tests += 1
+        counts = Counter(('passed' if result is True else 'failed' if result is False else 'error') for func_results in test_results.values() if isinstance(func_results, dict) for result in func_results.values())
+        total_tests = sum(counts.values())
+        passed_tests = counts['passed']
+        failed_tests = counts['failed']
+        error_tests = counts['error']
         return {"total_tests": total_tests,"passed_tests": passed_tests,"failed_tests": failed_tests,"error_tests": error_tests,"pass_rate": round(passed_tests / total_tests * 100, 2) if total_tests > 0 else 0}
 
+def dumps_report(report: Dict[str, Any]) -> bytes:
+    """Serializa el reporte a JSON una sola vez (con orjson si está disponible)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
+
 def main():
     """Función principal"""
-    if len(sys.argv) < 2:
-        print("Uso: python unity.py <archivo_python>")
+    args = [arg for arg in sys.argv[1:] if arg != '--quiet']
+    quiet = len(args) < len(sys.argv) - 1
+    if not args:
+        print("Uso: python unity.py <archivo_python> [--quiet]")
         print("Ejemplo: python unity.py mi_modulo.py")
         sys.exit(1)
-    file_path = sys.argv[1]
+    file_path = args[0]
     config = SecurityConfig(max_execution_time=30,max_memory_mb=512,max_file_size_mb=10)
     try:
         analyzer = UnityAnalyzer(config)
         report = analyzer.generate_performance_report(file_path)
         output_file = 'performance_report.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=4, ensure_ascii=False)
-        print(json.dumps(report, indent=4, ensure_ascii=False))
+        payload = dumps_report(report)
+        with open(output_file, 'wb') as f:
+            f.write(payload)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(payload + b"\n")
+        sys.stdout.buffer.flush()
         if report.get("status") == "success":
             print(f"\n✅ Análisis completado exitosamente")
             print(f"📊 Reporte guardado en: {output_file}")
@@ -389,7 +551,8 @@ def main():
             sys.exit(1)
     except Exception as e:
         print(f"Error crítico: {e}")
-        traceback.print_exc()
+        if not quiet:
+            traceback.print_exception(type(e), e, e.__traceback__, limit=-10)
         sys.exit(1)
 
 if __name__ == "__main__":